@@ -9,6 +9,7 @@ bl_info = {
 }
 
 import bpy
+from collections import deque
 from bpy.props import PointerProperty
 from bpy.types import Operator, Panel
 
@@ -16,35 +17,54 @@ from bpy.types import Operator, Panel
 # -------- Utilities --------
 
 def iter_hierarchy(root_obj):
-    """Yield root_obj and all its descendants (depth-first)."""
-    stack = [root_obj]
-    while stack:
-        obj = stack.pop()
+    """Yield root_obj and all its descendants (breadth-first).
+
+    `Object.children` rebuilds a tuple by scanning all objects on every
+    access, so deep hierarchies pay O(scene) per node. One pass over
+    `bpy.data.objects` grouping by parent replaces all those scans.
+    """
+    children_by_parent = {}
+    for obj in bpy.data.objects:
+        children_by_parent.setdefault(obj.parent, []).append(obj)
+
+    queue = deque((root_obj,))
+    while queue:
+        obj = queue.popleft()
         yield obj
-        # Children order doesn't matter; extend the stack
-        stack.extend(obj.children)
+        queue.extend(children_by_parent.get(obj, ()))
 
 
 def apply_material_to_object(obj, mat):
-    """Assign material to all slots (or create one) for objects that support materials."""
+    """Assign material to all slots (or create one) for objects that support materials.
+
+    Returns True if the object supports materials, False otherwise.
+    """
     data = getattr(obj, "data", None)
     if not data:
-        return
+        return False
 
     # Objects like Mesh, Curve, Text, GPencil (strokes), etc. that have .materials
     mats = getattr(data, "materials", None)
     if mats is None:
-        return
+        return False
+
+    # Already in the desired state? Skip the writes entirely.
+    if len(mats) == 1 and mats[0] == mat:
+        return True
 
     # Ensure at least one slot exists
     if len(mats) == 0:
         mats.append(mat)
     else:
-        for i in range(len(mats)):
-            mats[i] = mat
+        # Every slot ends up holding the same material anyway, so collapse
+        # to a single slot: one revalidation instead of one per slot.
+        while len(mats) > 1:
+            mats.pop()
+        mats[0] = mat
 
     # Make it active as well
     obj.active_material = mat
+    return True
 
 
 # -------- Properties (stored on Scene) --------
@@ -69,8 +89,10 @@ def scene_props_register():
 
 def scene_props_unregister():
     for attr in ("amc_target_object", "amc_material"):
-        if hasattr(bpy.types.Scene, attr):
+        try:
             delattr(bpy.types.Scene, attr)
+        except AttributeError:
+            pass
 
 
 # -------- Operator --------
@@ -95,11 +117,8 @@ class AMC_OT_apply_material_hierarchy(Operator):
 
         count_supported = 0
         for obj in iter_hierarchy(target):
-            before = getattr(getattr(obj, "data", None), "materials", None)
             try:
-                apply_material_to_object(obj, mat)
-                after = getattr(getattr(obj, "data", None), "materials", None)
-                if after is not None:
+                if apply_material_to_object(obj, mat):
                     count_supported += 1
             except Exception as e:
                 # Skip objects that cannot accept materials
@@ -121,15 +140,16 @@ class AMC_PT_panel(Panel):
     def draw(self, context):
         layout = self.layout
         scene = context.scene
+        active = context.view_layer.objects.active
 
         col = layout.column(align=True)
         col.prop(scene, "amc_target_object", text="Object")
 
         # Show active object name as a hint if target is empty
-        if scene.amc_target_object is None and context.view_layer.objects.active:
+        if scene.amc_target_object is None and active:
             row = col.row()
             row.enabled = False
-            row.label(text=f"(Active: {context.view_layer.objects.active.name})")
+            row.label(text=f"(Active: {active.name})")
 
         col.prop(scene, "amc_material", text="Material")
 
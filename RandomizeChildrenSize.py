@@ -9,7 +9,7 @@ bl_info = {
 }
 
 import bpy
-import random
+import numpy as np
 from bpy.props import PointerProperty, FloatProperty, EnumProperty
 from bpy.types import Operator, Panel
 
@@ -47,8 +47,10 @@ def register_props():
 
 def unregister_props():
     for attr in ("rcs_parent_object", "rcs_min_scale", "rcs_max_scale", "rcs_scale_mode"):
-        if hasattr(bpy.types.Scene, attr):
+        try:
             delattr(bpy.types.Scene, attr)
+        except AttributeError:
+            pass
 
 # -------------------- Operator --------------------
 
@@ -71,18 +73,26 @@ class RCS_OT_randomize_children_scale(Operator):
         if min_s > max_s:
             min_s, max_s = max_s, min_s  # swap if inverted
 
-        children = [ch for ch in parent.children]
+        # Object.children already yields a tuple; no need to copy it into a list.
+        children = parent.children
         if not children:
             self.report({"WARNING"}, f"'{parent.name}' has no direct children.")
             return {"CANCELLED"}
 
         mode = scene.rcs_scale_mode
+        # Resolve the enum compare once instead of once per child.
+        multiply = mode == "MULTIPLY"
 
-        for ch in children:
+        # Draw all factors in one vectorized call instead of one
+        # random.uniform per child.
+        factors = np.random.default_rng().uniform(min_s, max_s, len(children))
+
+        for ch, f in zip(children, factors):
             try:
-                f = random.uniform(min_s, max_s)
-                if mode == "MULTIPLY":
-                    ch.scale = (ch.scale.x * f, ch.scale.y * f, ch.scale.z * f)
+                if multiply:
+                    # Read the scale vector once instead of per component.
+                    s = ch.scale
+                    ch.scale = (s[0] * f, s[1] * f, s[2] * f)
                 else:  # ABSOLUTE
                     ch.scale = (f, f, f)
             except Exception as e:
@@ -104,13 +114,14 @@ class RCS_PT_panel(Panel):
     def draw(self, context):
         layout = self.layout
         scene = context.scene
+        active = context.view_layer.objects.active
 
         col = layout.column(align=True)
         col.prop(scene, "rcs_parent_object", text="Parent")
-        if scene.rcs_parent_object is None and context.view_layer.objects.active:
+        if scene.rcs_parent_object is None and active:
             row = col.row()
             row.enabled = False
-            row.label(text=f"(Active: {context.view_layer.objects.active.name})")
+            row.label(text=f"(Active: {active.name})")
 
         col.separator()
         col.prop(scene, "rcs_scale_mode", text="Mode")
